@@ -4,10 +4,10 @@
 
 import re
 from abc import ABCMeta, abstractmethod
-from collections import MutableMapping, OrderedDict
-from inspect import ismethod
+from collections import OrderedDict
 from decimal import Decimal
 from datetime import datetime
+from functools import lru_cache
 import pytz
 
 
@@ -32,24 +32,61 @@ _NORMALIZE = {'STARS': {'pokerstars', 'stars', 'ps'},
               'R': {'real money'},
               'P': {'play money'}}
 
+# every form mapped to its normalized value, so normalize is one dict lookup
+_NORMALIZED = {form: normalized for normalized, forms in _NORMALIZE.items() for form in forms}
+
+# split lines which mark the start of a section
+_SECTION_NAMES = frozenset({'HOLE CARDS', 'FLOP', 'TURN', 'RIVER', 'SHOW DOWN', 'SUMMARY'})
+
+# month abbreviations in PKR dates
+_MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+           'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
+
+# PKR has the biggest tables with 10 seats
+_EMPTY_SEATS = tuple(('Empty Seat %s' % num, Decimal(0)) for num in range(1, 11))
+
 
 def normalize(value):
     """Normalize common words which can be in multiple form, but all means the same."""
 
     value = value.lower()
-    for normalized, compare in _NORMALIZE.items():
-        if value in compare:
-            return normalized
-    return value.upper()
+    return _NORMALIZED.get(value, value.upper())
 
 
-class PokerHand(MutableMapping):
-    """Abstract base class for *all* room-specific parser."""
+@lru_cache(maxsize=4096)
+def _decimal(value):
+    """Shared Decimal for the stake, stack and pot strings, which repeat a lot across hands."""
+    return Decimal(value)
+
+
+@lru_cache(maxsize=4096)
+def _utc_offset(timezone, hour):
+    """UTC offset of the given local hour. DST changes only on whole hours, so it's valid for every minute."""
+    return timezone.localize(hour).utcoffset()
 
-    __metaclass__ = ABCMeta
+
+class PokerHand(metaclass=ABCMeta):
+    """Abstract base class for *all* room-specific parser."""
 
     _non_hand_attributes = ('raw', 'parsed', 'header_parsed', 'date_format')
 
+    # every documented hand attribute, subclasses extend it with their room specific ones
+    _HAND_ATTRS = frozenset({
+        'poker_room', 'ident', 'game_type', 'tournament_ident', 'tournament_level', 'currency',
+        'buyin', 'rake', 'game', 'limit', 'sb', 'bb', 'date', 'table_name', 'max_players',
+        'button_seat', 'button', 'hero', 'hero_seat', 'players', 'hero_hole_cards',
+        'flop', 'turn', 'river', 'board', 'preflop_actions', 'flop_actions', 'turn_actions',
+        'river_actions', 'total_pot', 'show_down', 'winners'
+    })
+    # keys() and iteration order
+    _HAND_KEYS = tuple(sorted(_HAND_ATTRS))
+    # poker_room is a class attribute
+    __slots__ = (('raw', 'header_parsed', 'parsed', '_splitted', '_parsed_parts') +
+                 tuple(sorted(_HAND_ATTRS - {'poker_room'})))
+
+    # (method name, attributes it sets) pairs: the body is parsed part by part on first access
+    _body_parsers = ()
+
     @abstractmethod
     def __init__(self, hand_text, parse=True):
         """Save raw hand history."""
@@ -57,9 +94,29 @@ class PokerHand(MutableMapping):
         self.raw = hand_text.strip()
         self.header_parsed = False
         self.parsed = False
+        self._parsed_parts = set()
+
+    def __getattr__(self, name):
+        """Called only for attributes not set yet. Parses the header or the part of the body which sets it,
+        hand attributes not found in the hand history are None.
+        """
+        for parser, attributes in self._body_parsers:
+            if name in attributes:
+                if parser not in self._parsed_parts:
+                    self._parse_part(parser)
+                    return getattr(self, name)
+                break
+        else:
+            # every other hand attribute is set by the header
+            if name in self._HAND_ATTRS and not self.header_parsed:
+                self._parse_part('parse_header')
+                return getattr(self, name)
+        if name in self._HAND_ATTRS:
+            return None
+        raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
 
     def __len__(self):
-        return len(self.keys())
+        return len(self._HAND_ATTRS)
 
     def __getitem__(self, key):
         if key not in self._non_hand_attributes:
@@ -67,14 +124,8 @@ class PokerHand(MutableMapping):
         else:
             raise KeyError('You can only get it via ''the attribute like "hand.{}"'.format(key))
 
-    def __setitem__(self, key, value):
-        setattr(self, key, value)
-
-    def __delitem__(self, key):
-        delattr(self, key)
-
     def __iter__(self):
-        return iter(self.keys())
+        return iter(self._HAND_KEYS)
 
     def __str__(self):
         return "<{}: {} hand #{}>" .format(
@@ -82,22 +133,40 @@ class PokerHand(MutableMapping):
         )
 
     def keys(self):
-        return [attr for attr in dir(self) if not attr.startswith('_') and
-                                              attr not in self._non_hand_attributes and
-                                              not ismethod(getattr(self, attr))]
+        return self._HAND_KEYS
 
     @abstractmethod
     def parse_header(self):
         """Parses the first line of a hand history."""
 
-    @abstractmethod
     def parse(self):
         """Parses the body of the hand history, but first parse header if not yet parsed."""
         if not self.header_parsed:
             self.parse_header()
+        for parser, attributes in self._body_parsers:
+            if parser not in self._parsed_parts:
+                self._parse_part(parser)
+
+        self.parsed = True
 
-    @property
-    def board(self):
+    def _parse_part(self, parser):
+        # mark a body part first, so attributes it doesn't set read as None instead of parsing it again,
+        # the header has header_parsed for that
+        if parser != 'parse_header':
+            self._parsed_parts.add(parser)
+        try:
+            getattr(self, parser)()
+        except AttributeError as error:
+            # raised through __getattr__ it would look like a missing attribute, e.g. for getattr(hand, name, None)
+            self._parsed_parts.discard(parser)
+            raise ValueError('cannot parse {}'.format(parser)) from error
+        except Exception:
+            self._parsed_parts.discard(parser)
+            raise
+        if self.header_parsed and len(self._parsed_parts) == len(self._body_parsers):
+            self.parsed = True
+
+    def _compute_board(self):
         """Calculates board from flop, turn and river."""
         board = []
         if self.flop:
@@ -109,11 +178,38 @@ class PokerHand(MutableMapping):
         return tuple(board) if board else None
 
     def _parse_date(self, date_string):
-        date = datetime.strptime(date_string, self.date_format)
-        self.date = self._TZ.localize(date).astimezone(pytz.UTC)
+        # strptime is implemented in Python, one match of a precompiled pattern is much cheaper
+        match = self._datetime_re.match(date_string)
+        if match:
+            month = match.group('month')
+            month = int(month) if month.isdigit() else _MONTHS[month]
+            date = datetime(int(match.group('year')), month, int(match.group('day')),
+                            int(match.group('hour')), int(match.group('minute')), int(match.group('second')))
+        else:
+            date = datetime.strptime(date_string, self.date_format)
+        offset = _utc_offset(self._TZ, date.replace(minute=0, second=0))
+        self.date = (date - offset).replace(tzinfo=pytz.UTC)
+
+    def _index_sections(self):
+        """Search the first, second and last split locations (basically empty strings)
+        and the first index of every section name in one pass.
+        """
+        first = second = last = None
+        section_index = {}
+        for ind, elem in enumerate(self._splitted):
+            if not elem:
+                if first is None:
+                    first = ind
+                elif second is None:
+                    second = ind
+                last = ind
+            elif elem in _SECTION_NAMES and elem not in section_index:
+                section_index[elem] = ind
+        self._sections_first, self._sections_second, self._sections_last = first, second, last
+        self._section_index = section_index
 
     def _init_seats(self, player_num):
-        return [('Empty Seat %s' % num, Decimal(0)) for num in range(1, player_num + 1)]
+        return list(_EMPTY_SEATS[:player_num])
 
 
 class PokerStarsHand(PokerHand):
@@ -121,9 +217,14 @@ class PokerStarsHand(PokerHand):
 
     poker_room = 'STARS'
     date_format = '%Y/%m/%d %H:%M:%S ET'
+    _datetime_re = re.compile(r"^(?P<year>\d{4})/(?P<month>\d\d?)/(?P<day>\d\d?)[ ]"
+                              r"(?P<hour>\d\d?):(?P<minute>\d\d):(?P<second>\d\d)[ ]ET$", re.ASCII)
     _TZ = pytz.timezone('US/Eastern')  # ET
 
-    _split_re = re.compile(r" ?\*\*\* ?\n?|\n")
+    __slots__ = ('_sections_first', '_sections_second', '_sections_last', '_section_index')
+
+    # every alternative starts with a literal, so the regex engine can skip ahead to the candidates
+    _split_re = re.compile(r"\n|\*\*\* ?\n?| \*\*\* ?\n?")
     _header_re = re.compile(r"""
                         ^PokerStars[ ]                          # Poker Room
                         Hand[ ]\#(?P<ident>\d*):[ ]             # Hand number
@@ -138,15 +239,29 @@ class PokerStarsHand(PokerHand):
                         \((?P<sb>.*)/(?P<bb>.*)\)[ ]            # blinds
                         -[ ].*[ ]                               # localized date
                         \[(?P<date>.*)\]$                       # ET date
-                        """, re.VERBOSE)
-    _table_re = re.compile(r"^Table '(.*)' (\d)-max Seat #(\d) is the button$")
-    _seat_re = re.compile(r"^Seat (\d): (.*) \((\d*) in chips\)$")
-    _hole_cards_re = re.compile(r"^Dealt to (.*) \[(..) (..)\]$")
-    _pot_re = re.compile(r"^Total pot (\d*) .*\| Rake (\d*)$")
-    _winner_re = re.compile(r"^Seat (\d): (.*) collected \((\d*)\)$")
-    _showdown_re = re.compile(r"^Seat (\d): (.*) showed .* and won")
-    _ante_re = re.compile(r".*posts the ante (\d*)")
-    _board_re = re.compile(r"(?<=[\[ ])(..)(?=[\] ])")
+                        """, re.VERBOSE | re.ASCII)
+    # every table, seat and summary line we are interested in, dispatched on the matched group name
+    _body_re = re.compile(r"""
+                        (?P<table>Table[ ]'(?P<table_name>.*)'[ ]                # Table name
+                            (?P<max_players>\d)-max[ ]                          # max players
+                            Seat[ ]\#(?P<button_seat>\d)[ ]is[ ]the[ ]button$)  # button seat
+                        |Seat[ ](?P<seat_number>\d):[ ]                         # Seat number
+                            (?P<player>.*?)[ ](?:                               # Player name
+                            (?P<seat>\((?P<stack>\d*)[ ]in[ ]chips\)$)           # Stack
+                            |(?P<winner>collected[ ]\(\d*\)$)                    # winner
+                            |(?P<showdown>showed[ ].*[ ]and[ ]won))             # winner at showdown
+                        |(?P<hole_cards>Dealt[ ]to[ ](?P<hero>.*)[ ]             # Hero
+                            \[(?P<hero_card1>..)[ ](?P<hero_card2>..)\]$)       # Hole cards
+                        |(?P<pot>Total[ ]pot[ ](?P<total_pot>\d*)[ ].*\|[ ]Rake[ ]\d*$)
+                        |(?P<board>Board[ ]\[.*\]$)
+                        """, re.VERBOSE | re.ASCII)
+    _ante_re = re.compile(r".*posts the ante (\d*)", re.ASCII)
+
+    _body_parsers = (
+        ('_parse_body', {'table_name', 'max_players', 'button_seat', 'button', 'players', 'hero', 'hero_seat',
+                         'hero_hole_cards', 'show_down', 'total_pot', 'flop', 'turn', 'river', 'board', 'winners'}),
+        ('_parse_actions', {'preflop_actions', 'flop_actions', 'turn_actions', 'river_actions'}),
+    )
 
     def __init__(self, hand_text, parse=True):
         """Split hand history by sections and parse."""
@@ -154,20 +269,20 @@ class PokerStarsHand(PokerHand):
         self._splitted = self._split_re.split(self.raw)
 
         # search split locations (basically empty strings)
-        # sections[0] is before HOLE CARDS
-        # sections[-1] is before SUMMARY
-        self._sections = [ind for ind, elem in enumerate(self._splitted) if not elem]
+        # first is before HOLE CARDS, second is after preflop actions
+        # last is before SUMMARY
+        self._index_sections()
 
         if parse:
-            self.parse()
+            self.parse_header()
 
     def parse_header(self):
         match = self._header_re.match(self._splitted[0])
         self.game_type = normalize(match.group('game_type'))
-        self.sb = Decimal(match.group('sb'))
-        self.bb = Decimal(match.group('bb'))
-        self.buyin = Decimal(match.group('buyin'))
-        self.rake = Decimal(match.group('rake'))
+        self.sb = _decimal(match.group('sb'))
+        self.bb = _decimal(match.group('bb'))
+        self.buyin = _decimal(match.group('buyin'))
+        self.rake = _decimal(match.group('rake'))
         self._parse_date(match.group('date'))
         self.game = normalize(match.group('game'))
         self.limit = normalize(match.group('limit'))
@@ -178,87 +293,81 @@ class PokerStarsHand(PokerHand):
 
         self.header_parsed = True
 
-    def parse(self):
-        super(PokerStarsHand, self).parse()
-        self._parse_table()
-        self._parse_seats()
-        self._parse_hole_cards()
+    def _parse_body(self):
+        """Match the lines before the actions and the summary lines with the one _body_re pattern."""
+        self.show_down = show_down = 'SHOW DOWN' in self._section_index
+        winners, showdown_winners = set(), set()
+        seat_of = {}
+        players = button_seat = hero = None
+        body_match = self._body_re.match
+        # table, seats and hole cards are before the preflop actions, pot, board and winners are in summary
+        lines = self._splitted[1:self._sections_first + 3]
+        # most summary Seat lines are folded players, which can't match, so skip them without the regex
+        winning = 'won' if show_down else 'collected'
+        lines.extend(line for line in self._splitted[self._sections_last + 2:]
+                     if winning in line or not line.startswith('Seat '))
+        for line in lines:
+            match = body_match(line)
+            if not match:
+                continue
+            kind = match.lastgroup
+            if kind == 'seat':
+                if players is None:
+                    break  # no table line before the seats, raised below
+                seat_number = int(match.group('seat_number'))
+                player_name = match.group('player')
+                players[seat_number - 1] = (player_name, int(match.group('stack')))
+                seat_of[player_name] = seat_number
+            elif kind == 'winner':
+                winners.add(match.group('player'))
+            elif kind == 'showdown':
+                showdown_winners.add(match.group('player'))
+            elif kind == 'table':
+                self.table_name = match.group('table_name')
+                self.max_players = max_players = int(match.group('max_players'))
+                self.button_seat = button_seat = int(match.group('button_seat'))
+                players = self._init_seats(max_players)
+            elif kind == 'hole_cards':
+                self.hero = hero = match.group('hero')
+                self.hero_hole_cards = match.group('hero_card1', 'hero_card2')
+            elif kind == 'pot':
+                self.total_pot = int(match.group('total_pot'))
+            elif kind == 'board':
+                self._parse_board(match.group('board'))
+
+        if players is None or hero is None:
+            raise ValueError('cannot parse _parse_body: no {} line'.format('table' if players is None else 'hole cards'))
+        self.button = players[button_seat - 1][0]
+        self.players = OrderedDict(players)
+        self.hero_seat = seat_of[hero]
+        self.board = self._compute_board()
+        self.winners = tuple(showdown_winners if show_down else winners)
+
+    def _parse_board(self, boardline):
+        cards = boardline[7:-1].split()  # cut off "Board [" and "]"
+        self.flop = tuple(cards[:3]) if cards else None
+        self.turn = cards[3] if len(cards) > 3 else None
+        self.river = cards[4] if len(cards) > 4 else None
+
+    def _parse_actions(self):
         self._parse_preflop()
         self._parse_street('flop')
         self._parse_street('turn')
         self._parse_street('river')
-        self.show_down = "SHOW DOWN" in self._splitted
-        self._parse_pot()
-        self._parse_board()
-        self._parse_winners()
-
-        self.parsed = True
-
-    def _parse_table(self):
-        match = self._table_re.match(self._splitted[1])
-        self.table_name = match.group(1)
-        self.max_players = int(match.group(2))
-        self.button_seat = int(match.group(3))
-
-    def _parse_seats(self):
-        players = self._init_seats(self.max_players)
-        for line in self._splitted[2:]:
-            match = self._seat_re.match(line)
-            if not match:
-                break
-            players[int(match.group(1)) - 1] = (match.group(2), int(match.group(3)))
-
-        self.button = players[self.button_seat - 1][0]
-        self.players = OrderedDict(players)
-
-    def _parse_hole_cards(self):
-        hole_cards_line = self._splitted[self._sections[0] + 2]
-        match = self._hole_cards_re.match(hole_cards_line)
-        self.hero = match.group(1)
-        self.hero_seat = list(self.players.keys()).index(self.hero) + 1
-        self.hero_hole_cards = match.group(2, 3)
 
     def _parse_preflop(self):
-        start = self._sections[0] + 3
-        stop = self._sections[1]
+        start = self._sections_first + 3
+        stop = self._sections_second
         self.preflop_actions = tuple(self._splitted[start:stop])
 
     def _parse_street(self, street):
         try:
-            start = self._splitted.index(street.upper()) + 2
-            stop = self._splitted.index('', start)
-            street_actions = self._splitted[start:stop]
-            setattr(self, "%s_actions" % street.lower(), tuple(street_actions) if street_actions else None)
-        except ValueError:
-            setattr(self, street, None)
-            setattr(self, '%s_actions' % street.lower(), None)
-
-    def _parse_pot(self):
-        potline = self._splitted[self._sections[-1] + 2]
-        match = self._pot_re.match(potline)
-        self.total_pot = int(match.group(1))
-
-    def _parse_board(self):
-        boardline = self._splitted[self._sections[-1] + 3]
-        if not boardline.startswith('Board'):
+            start = self._section_index[street.upper()] + 2
+        except KeyError:
             return
-        cards = self._board_re.findall(boardline)
-        self.flop = tuple(cards[:3]) if cards else None
-        self.turn = cards[3] if len(cards) > 3 else None
-        self.river = cards[4] if len(cards) > 4 else None
-
-    def _parse_winners(self):
-        winners = set()
-        start = self._sections[-1] + 4
-        for line in self._splitted[start:]:
-            if not self.show_down and "collected" in line:
-                match = self._winner_re.match(line)
-                winners.add(match.group(2))
-            elif self.show_down and "won" in line:
-                match = self._showdown_re.match(line)
-                winners.add(match.group(2))
-
-        self.winners = tuple(winners)
+        stop = self._splitted.index('', start)
+        street_actions = self._splitted[start:stop]
+        setattr(self, "%s_actions" % street.lower(), tuple(street_actions) if street_actions else None)
 
 
 class FullTiltHand(PokerHand):
@@ -266,9 +375,20 @@ class FullTiltHand(PokerHand):
 
     poker_room = 'FTP'
     date_format = '%H:%M:%S ET - %Y/%m/%d'
+    _datetime_re = re.compile(r"^(?P<hour>\d\d?):(?P<minute>\d\d):(?P<second>\d\d)[ ]ET[ ]-[ ]"
+                              r"(?P<year>\d{4})/(?P<month>\d\d?)/(?P<day>\d\d?)$", re.ASCII)
     _TZ = pytz.timezone('US/Eastern')  # ET
 
-    _split_re = re.compile(r" ?\*\*\* ?\n?|\n")
+    _HAND_ATTRS = PokerHand._HAND_ATTRS | {
+        'tournament_name', 'flop_pot', 'flop_num_players', 'turn_pot', 'turn_num_players',
+        'river_pot', 'river_num_players'
+    }
+    _HAND_KEYS = tuple(sorted(_HAND_ATTRS))
+    __slots__ = (('_sections_first', '_sections_second', '_sections_last', '_section_index', '_seat_of') +
+                 tuple(sorted(_HAND_ATTRS - PokerHand._HAND_ATTRS)))
+
+    # every alternative starts with a literal, so the regex engine can skip ahead to the candidates
+    _split_re = re.compile(r"\n|\*\*\* ?\n?| \*\*\* ?\n?")
 
     # header patterns
     _tournament_re = re.compile(r"""
@@ -277,18 +397,27 @@ class FullTiltHand(PokerHand):
                         (?P<tournament_name>.*)[ ]              # Tournament name
                         \((?P<tournament_ident>\d*)\),[ ]       # Tournament Number
                         Table[ ](?P<table_name>\d*)[ ]-[ ]      # Table name
-                        """, re.VERBOSE)
+                        """, re.VERBOSE | re.ASCII)
     _game_re = re.compile(r" - (?P<limit>NL|PL|FL|No Limit|Pot Limit|Fix Limit) (?P<game>.*?) - ")
-    _blind_re = re.compile(r" - (\d*)/(\d*) - ")
+    _blind_re = re.compile(r" - (\d*)/(\d*) - ", re.ASCII)
     _date_re = re.compile(r" \[(.*)\]$")
 
-    _seat_re = re.compile(r"^Seat (\d): (.*) \(([\d,]*)\)$")
-    _button_re = re.compile(r"^The button is in seat #(\d)$")
+    _seat_re = re.compile(r"^Seat (\d): (.*) \(([\d,]*)\)$", re.ASCII)
+    _button_re = re.compile(r"^The button is in seat #(\d)$", re.ASCII)
     _hole_cards_re = re.compile(r"^Dealt to (.*) \[(..) (..)\]$")
-    _street_re = re.compile(r"\[([^\]]*)\] \(Total Pot: (\d*)\, (\d) Players")
-    _pot_re = re.compile(r"^Total pot ([\d,]*) .*\| Rake (\d*)$")
-    _winner_re = re.compile(r"^Seat (\d): (.*) collected \((\d*)\),")
-    _showdown_re = re.compile(r"^Seat (\d): (.*) showed .* and won")
+    _street_re = re.compile(r"\[([^\]]*)\] \(Total Pot: (\d*)\, (\d) Players", re.ASCII)
+    _pot_re = re.compile(r"^Total pot ([\d,]*) .*\| Rake ([\d,]*)$", re.ASCII)
+    _winner_re = re.compile(r"^Seat (\d): (.*) collected \((\d*)\),", re.ASCII)
+    _showdown_re = re.compile(r"^Seat (\d): (.*) showed .* and won", re.ASCII)
+
+    _body_parsers = (
+        ('_parse_seats', {'players', 'max_players', 'button_seat', 'button', '_seat_of'}),
+        ('_parse_hole_cards', {'hero', 'hero_seat', 'hero_hole_cards'}),
+        ('_parse_actions', {'preflop_actions', 'flop', 'turn', 'river', 'board', 'flop_actions', 'turn_actions',
+                            'river_actions', 'flop_pot', 'turn_pot', 'river_pot', 'flop_num_players',
+                            'turn_num_players', 'river_num_players'}),
+        ('_parse_summary', {'show_down', 'total_pot', 'winners'}),
+    )
 
     def __init__(self, hand_text, parse=True):
         super(FullTiltHand, self).__init__(hand_text, parse)
@@ -296,12 +425,12 @@ class FullTiltHand(PokerHand):
         self._splitted = self._split_re.split(self.raw)
 
         # search split locations (basically empty strings)
-        # sections[0] is before HOLE CARDS
-        # sections[-1] is before SUMMARY
-        self._sections = [ind for ind, elem in enumerate(self._splitted) if not elem]
+        # first is before HOLE CARDS, second is after preflop actions
+        # last is before SUMMARY
+        self._index_sections()
 
         if parse:
-            self.parse()
+            self.parse_header()
 
     def parse_header(self):
         header_line = self._splitted[0]
@@ -318,8 +447,8 @@ class FullTiltHand(PokerHand):
         self.game = normalize(match.group('game'))
 
         match = self._blind_re.search(header_line)
-        self.sb = Decimal(match.group(1))
-        self.bb = Decimal(match.group(2))
+        self.sb = _decimal(match.group(1))
+        self.bb = _decimal(match.group(2))
 
         match = self._date_re.search(header_line)
         self._parse_date(match.group(1))
@@ -328,68 +457,59 @@ class FullTiltHand(PokerHand):
 
         self.header_parsed = True
 
-    def parse(self):
-        super(FullTiltHand, self).parse()
-
-        self._parse_seats()
-        self._parse_hole_cards()
-        self._parse_preflop()
-        self._parse_street('flop')
-        self._parse_street('turn')
-        self._parse_street('river')
-        self.show_down = 'SHOW DOWN' in self._splitted
-        self._parse_pot()
-        self._parse_winners()
-
-        self.parsed = True
-
     def _parse_seats(self):
         # In hh there is no indication of max_players, so init for 9.
         players = self._init_seats(9)
+        self._seat_of = {}
+        seat_match = self._seat_re.match
         for line in self._splitted[1:]:
-            match = self._seat_re.match(line)
+            match = seat_match(line)
             if not match:
                 break
             seat_number = int(match.group(1))
             player_name = match.group(2)
             stack = int(match.group(3).replace(',', ''))
             players[seat_number - 1] = (player_name, stack)
+            self._seat_of[player_name] = seat_number
         self.max_players = seat_number
         self.players = OrderedDict(players[:self.max_players])  # cut off unneccesary seats
 
         # one line before the first split.
-        button_line = self._splitted[self._sections[0] - 1]
+        button_line = self._splitted[self._sections_first - 1]
         self.button_seat = int(self._button_re.match(button_line).group(1))
         self.button = players[self.button_seat - 1][0]
 
     def _parse_hole_cards(self):
-        hole_cards_line = self._splitted[self._sections[0] + 2]
+        hole_cards_line = self._splitted[self._sections_first + 2]
         match = self._hole_cards_re.match(hole_cards_line)
         self.hero = match.group(1)
-        self.hero_seat = list(self.players.keys()).index(self.hero) + 1
+        self.hero_seat = self._seat_of[self.hero]
         self.hero_hole_cards = match.group(2, 3)
 
+    def _parse_actions(self):
+        self._parse_preflop()
+        self._parse_street('flop')
+        self._parse_street('turn')
+        self._parse_street('river')
+        self.board = self._compute_board()
+
     def _parse_preflop(self):
-        start = self._sections[0] + 3
-        stop = self._sections[1]
+        start = self._sections_first + 3
+        stop = self._sections_second
         self.preflop_actions = tuple(self._splitted[start:stop])
 
     def _parse_street(self, street):
         try:
-            start = self._splitted.index(street.upper()) + 1
-            self._parse_boardline(start, street)
-            stop = next(v for v in self._sections if v > start)
-            street_actions = self._splitted[start + 1:stop]
-            setattr(self, "%s_actions" % street, tuple(street_actions) if street_actions else None)
-        except ValueError:
-            setattr(self, street, None)
-            setattr(self, '%s_actions' % street, None)
-            setattr(self, '%s_pot' % street, None)
-            setattr(self, '%s_num_players' % street, None)
+            start = self._section_index[street.upper()] + 1
+        except KeyError:
+            return
+        self._parse_boardline(start, street)
+        stop = self._splitted.index('', start)
+        street_actions = self._splitted[start + 1:stop]
+        setattr(self, "%s_actions" % street, tuple(street_actions) if street_actions else None)
 
     def _parse_boardline(self, start, street):
         """Parse pot, num players and cards."""
-        # Exceptions caught in _parse_street.
         board_line = self._splitted[start]
 
         match = self._street_re.search(board_line)
@@ -398,26 +518,32 @@ class FullTiltHand(PokerHand):
         setattr(self, street, cards)
 
         pot = match.group(2)
-        setattr(self, "%s_pot" % street, Decimal(pot))
+        setattr(self, "%s_pot" % street, _decimal(pot))
 
         num_players = int(match.group(3))
         setattr(self, "%s_num_players" % street, num_players)
 
+    def _parse_summary(self):
+        self.show_down = 'SHOW DOWN' in self._section_index
+        self._parse_pot()
+        self._parse_winners(self.show_down)
+
     def _parse_pot(self):
-        potline = self._splitted[self._sections[-1] + 2]
-        match = self._pot_re.match(potline.replace(',', ''))
-        self.total_pot = int(match.group(1))
+        potline = self._splitted[self._sections_last + 2]
+        match = self._pot_re.match(potline)
+        self.total_pot = int(match.group(1).replace(',', ''))
+
+    def _parse_winners(self, show_down):
+        if show_down:
+            winning, winner_match = 'won', self._showdown_re.match
+        else:
+            winning, winner_match = 'collected', self._winner_re.match
 
-    def _parse_winners(self):
         winners = set()
-        start = self._sections[-1] + 4
+        start = self._sections_last + 4
         for line in self._splitted[start:]:
-            if not self.show_down and "collected" in line:
-                match = self._winner_re.match(line)
-                winners.add(match.group(2))
-            elif self.show_down and "won" in line:
-                match = self._showdown_re.match(line)
-                winners.add(match.group(2))
+            if winning in line:
+                winners.add(winner_match(line).group(2))
 
         self.winners = tuple(winners)
 
@@ -427,19 +553,34 @@ class PKRHand(PokerHand):
 
     poker_room = 'PKR'
     date_format = '%d %b %Y %H:%M:%S'
+    _datetime_re = re.compile(r"^(?P<day>\d\d?)[ ](?P<month>[A-Z][a-z]{2})[ ](?P<year>\d{4})[ ]"
+                              r"(?P<hour>\d\d?):(?P<minute>\d\d):(?P<second>\d\d)$", re.ASCII)
     currency = 'USD'
     _TZ = pytz.UTC
 
+    _HAND_ATTRS = PokerHand._HAND_ATTRS | {
+        'last_ident', 'money_type', 'tournament_name', 'flop_pot', 'turn_pot', 'river_pot'
+    }
+    _HAND_KEYS = tuple(sorted(_HAND_ATTRS))
+    __slots__ = ('_sections', '_seat_of') + tuple(sorted(_HAND_ATTRS - PokerHand._HAND_ATTRS))
+
     _split_re = re.compile(r"Dealing |\nDealing Cards\n|Taking |Moving |\n")
-    _blinds_re = re.compile(r"^Blinds are now \$([\d.]*) / \$([\d.]*)$")
     _dealt_re = re.compile(r"^\[(. .)\]\[(. .)\] to (.*)$")
-    _seat_re = re.compile(r"^Seat (\d\d?): (.*) - \$([\d.]*) ?(.*)$")
-    _sizes_re = re.compile(r"^Pot sizes: \$([\d.]*)$")
+    _seat_re = re.compile(r"^Seat (\d\d?): (.*) - \$([\d.]*) ?(.*)$", re.ASCII)
+    _sizes_re = re.compile(r"^Pot sizes: \$([\d.]*)$", re.ASCII)
     _card_re = re.compile(r"\[(. .)\]")
-    _rake_re = re.compile(r"Rake of \$([\d.]*) from pot \d$")
-    _win_re = re.compile(r"^(.*) wins \$([\d.]*) with: ")
+    _rake_re = re.compile(r"Rake of \$([\d.]*) from pot \d$", re.ASCII)
+    _win_re = re.compile(r"^(.*) wins \$([\d.]*) with: ", re.ASCII)
     SPLIT_CARD_SPACE = slice(0, 3, 2)
 
+    _body_parsers = (
+        ('_parse_seats', {'players', 'max_players', 'button_seat', 'button', '_seat_of'}),
+        ('_parse_hero', {'hero', 'hero_seat', 'hero_hole_cards'}),
+        ('_parse_actions', {'preflop_actions', 'flop', 'turn', 'river', 'board', 'flop_actions', 'turn_actions',
+                            'river_actions', 'flop_pot', 'turn_pot', 'river_pot'}),
+        ('_parse_showdown', {'rake', 'show_down', 'winners', 'total_pot'}),
+    )
+
     def __init__(self, hand_text, parse=True):
         """Split hand history by sections and parse."""
         super(PKRHand, self).__init__(hand_text, parse)
@@ -453,7 +594,7 @@ class PKRHand(PokerHand):
         self._sections = [ind for ind, elem in enumerate(self._splitted) if not elem]
 
         if parse:
-            self.parse()
+            self.parse_header()
 
     def parse_header(self):
         self.table_name = self._splitted[0][6:]          # cut off "Table "
@@ -465,40 +606,32 @@ class PKRHand(PokerHand):
         self.game_type = normalize(self._splitted[6][12:])   # cut off "Table Type: "
         self.money_type = normalize(self._splitted[7][12:])  # cut off "Money Type: "
 
-        match = self._blinds_re.match(self._splitted[8])
-        self.sb = Decimal(match.group(1))
-        self.bb = Decimal(match.group(2))
+        sb, _, bb = self._splitted[8][16:].partition(' / $')  # cut off "Blinds are now $"
+        self.sb = _decimal(sb)
+        self.bb = _decimal(bb)
         self.buyin = self.bb * 100
 
-        self.button = int(self._splitted[9][18:])  # cut off "Button is at seat "
-
         self.tournament_ident = None
         self.tournament_name = None
         self.tournament_level = None
 
-    def parse(self):
-        super(PKRHand, self).parse()
-
-        self._parse_seats()
-        self._parse_hero()
-        self._parse_preflop()
-        self._parse_street('flop')
-        self._parse_street('turn')
-        self._parse_street('river')
-        self._parse_showdown()
+        self.header_parsed = True
 
     def _parse_seats(self):
         # In hh there is no indication of max_players,
         # so init for 10, as there are 10 player tables on PKR.
         players = self._init_seats(10)
+        self._seat_of = {}
+        seat_match = self._seat_re.match
         for line in self._splitted[10:]:
-            match = self._seat_re.match(line)
+            match = seat_match(line)
             if not match:
                 break
             seat_number = int(match.group(1))
             player_name = match.group(2)
-            stack = Decimal(match.group(3))
+            stack = _decimal(match.group(3))
             players[seat_number - 1] = (player_name, stack)
+            self._seat_of[player_name] = seat_number
         self.max_players = seat_number
         self.players = OrderedDict(players[:self.max_players])
 
@@ -519,7 +652,14 @@ class PKRHand(PokerHand):
         self.hero_hole_cards = (first, second)
 
         self.hero = match.group(3)
-        self.hero_seat = list(self.players.keys()).index(self.hero) + 1
+        self.hero_seat = self._seat_of[self.hero]
+
+    def _parse_actions(self):
+        self._parse_preflop()
+        self._parse_street('flop')
+        self._parse_street('turn')
+        self._parse_street('river')
+        self.board = self._compute_board()
 
     def _parse_preflop(self):
         start = self._sections[1] + 2
@@ -531,38 +671,71 @@ class PKRHand(PokerHand):
         section = street_sections[street]
         try:
             start = self._sections[section] + 1
+        except IndexError:
+            return
 
-            street_line = self._splitted[start]
-            cards = list(map(lambda x: x[self.SPLIT_CARD_SPACE], self._card_re.findall(street_line)))
-            setattr(self, street, tuple(cards) if street == 'flop' else cards[0])
+        street_line = self._splitted[start]
+        cards = list(map(lambda x: x[self.SPLIT_CARD_SPACE], self._card_re.findall(street_line)))
+        # the hand ended before this street, its section is the rake and showdown
+        if not cards:
+            return
+        setattr(self, street, tuple(cards) if street == 'flop' else cards[0])
 
-            stop = next(v for v in self._sections if v > start) - 1
-            setattr(self, "%s_actions" % street, tuple(self._splitted[start + 1:stop]))
+        stop = next(v for v in self._sections if v > start) - 1
+        setattr(self, "%s_actions" % street, tuple(self._splitted[start + 1:stop]))
 
-            sizes_line = self._splitted[start - 2]
-            pot = Decimal(self._sizes_re.match(sizes_line).group(1))
-            setattr(self, "%s_pot" % street, pot)
-        except IndexError:
-            setattr(self, street, None)
-            setattr(self, "%s_actions" % street, None)
-            setattr(self, "%s_pot" % street, None)
+        sizes_line = self._splitted[start - 2]
+        pot = _decimal(self._sizes_re.match(sizes_line).group(1))
+        setattr(self, "%s_pot" % street, pot)
 
     def _parse_showdown(self):
         start = self._sections[-1] + 1
 
         rake_line = self._splitted[start]
         match = self._rake_re.match(rake_line)
-        self.rake = Decimal(match.group(1))
+        self.rake = rake = _decimal(match.group(1))
 
+        self.show_down = False
         winners = []
-        total_pot = self.rake
+        total_pot = rake
         for line in self._splitted[start:]:
             if 'shows' in line:
                 self.show_down = True
             elif 'wins' in line:
                 match = self._win_re.match(line)
                 winners.append(match.group(1))
-                total_pot += Decimal(match.group(2))
+                total_pot += _decimal(match.group(2))
 
         self.winners = tuple(winners)
         self.total_pot = total_pot
+
+
+_ROOM_CLASSES = {hand_class.poker_room: hand_class for hand_class in (PokerStarsHand, FullTiltHand, PKRHand)}
+
+# first line(s) of a hand, the group names are the poker_room of the hand classes
+_HAND_START_RE = re.compile(r"""
+                        ^(?P<STARS>PokerStars[ ]Hand[ ]\#)
+                        |^(?P<FTP>Full[ ]Tilt[ ]Poker[ ]Game[ ]\#)
+                        |^(?P<PKR>Table[ ]\#.*\nStarting[ ]Hand[ ]\#)
+                        """, re.VERBOSE | re.MULTILINE)
+
+
+def iter_hands(history, parse=True):
+    """Find every hand in a hand history file with one scan and yield them with the right room class."""
+
+    # PokerStars exports usually start with a BOM
+    if history.startswith('\ufeff'):
+        history = history[1:]
+
+    hand_class = start = None
+    for match in _HAND_START_RE.finditer(history):
+        if hand_class is not None:
+            yield hand_class(history[start:match.start()], parse)
+        elif history[:match.start()].strip():
+            raise ValueError('Not a hand before the first hand: {!r}'.format(history[:match.start()][:50]))
+        hand_class, start = _ROOM_CLASSES[match.lastgroup], match.start()
+
+    if hand_class is not None:
+        yield hand_class(history[start:], parse)
+    elif history.strip():
+        raise ValueError('Not a hand: {!r}'.format(history[:50]))
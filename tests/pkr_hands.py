@@ -54,6 +54,52 @@ Seat 4: Walkman - $49.75
 Seat 6: barly123 - $55.42
 End of Hand #2433297728"""
 
+HANDS['holdem_flop_only'] = """
+Table #52121155 - Rapanui's Leela
+Starting Hand #2433297728
+Start time of hand: 05 Oct 2013 01:15:45
+Last Hand #2433297369
+Game Type: HOLD'EM
+Limit Type: NO LIMIT
+Table Type: RING
+Money Type: REAL MONEY
+Blinds are now $0.25 / $0.50
+Button is at seat 1
+Seat 1: laxi23 - $51.89
+Seat 2: NikosMRF - $50 (away from table)
+Seat 3: Capricorn - $33.60
+Seat 4: Walkman - $50
+Seat 6: barly123 - $50.35
+Shuffling Deck
+Moving Button to seat 3
+Walkman posts small blind ($0.25)
+barly123 posts big blind ($0.50)
+Dealing Cards
+Dealing [9 s][6 d] to Walkman
+laxi23 folds
+Capricorn calls $0.50
+Walkman folds
+barly123 raises to $1.25
+Capricorn calls $1.25
+Pot sizes: $2.75
+Dealing Flop [7 d][3 c][J d]
+barly123 checks
+Capricorn bets $1.37
+barly123 raises to $4.11
+Capricorn calls $4.11
+Pot sizes: $10.97
+Taking Rake of $0.54 from pot 1
+barly123 shows [A h][J c]
+barly123 has Three of a Kind: Jacks
+Capricorn mucks
+barly123 wins $10.43 with: Three of a Kind: Jacks
+Seat 1: laxi23 - $51.89
+Seat 2: NikosMRF - $50
+Seat 3: Capricorn - $28.24
+Seat 4: Walkman - $49.75
+Seat 6: barly123 - $55.42
+End of Hand #2433297728"""
+
 HANDS['holdem_preflop_only'] = """
 Table #52121155 - Rapanui's Leela
 Starting Hand #2433296988
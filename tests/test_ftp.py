@@ -156,3 +156,10 @@ class TestHandWithFlopTurnRiver:
                              ])
     def test_body(self, hand, attribute, expected_value):
         assert getattr(hand, attribute) == expected_value
+
+
+class TestHandWithThousandsRake:
+    hand_text = ftp_hands.HAND2.replace('Total pot 3,990 | Rake 0', 'Total pot 3,990 | Rake 1,000')
+
+    def test_total_pot(self, hand):
+        assert hand.total_pot == Decimal('3990')
@@ -1,7 +1,6 @@
-from collections import MutableMapping
 import pytest
-from handparser import PokerStarsHand
-from . import stars_hands
+from handparser import PokerStarsHand, FullTiltHand, PKRHand, iter_hands
+from . import stars_hands, ftp_hands, pkr_hands
 
 
 class TestDictBehavior:
@@ -11,8 +10,13 @@ class TestDictBehavior:
                      'flop_actions', 'button', 'flop', 'game_type', 'players', 'table_name', 'sb', 'total_pot',
                      'river', 'tournament_level'}
 
-    def test_hand_is_mutablemapping(self, all_hands):
-        assert isinstance(all_hands, MutableMapping)
+    def test_hand_reads_like_a_dict(self, all_hands):
+        assert all_hands['ident'] == all_hands.ident
+        assert self.expected_keys == set(dict(all_hands))
+
+    def test_hand_is_read_only_as_a_dict(self, all_hands):
+        with pytest.raises(TypeError):
+            all_hands['ident'] = '1'
 
     def test_all_keys_set(self, all_hands):
         assert self.expected_keys == set(all_hands.keys())
@@ -24,6 +28,9 @@ class TestDictBehavior:
     def test_raw_is_an_attribute(self, all_hands):
         assert hasattr(all_hands, 'raw')
 
+    def test_hand_has_no_instance_dict(self, all_hands):
+        assert not hasattr(all_hands, '__dict__')
+
     def test_there_should_be_not_only_one_but_thirtyfour_keys(self, all_hands):
         assert 32 == len(all_hands) == len(all_hands.keys())
 
@@ -32,4 +39,105 @@ class TestDictBehavior:
             _non_hand_attributes = ()
 
         hand = ModdedPokerStarsHand(stars_hands.HAND1)
-        assert self.expected_keys | set(PokerStarsHand._non_hand_attributes) == set(hand.keys())
+        assert self.expected_keys == set(hand.keys())
+        assert set(hand.keys()) == ModdedPokerStarsHand._HAND_ATTRS
+
+    def test_keys_are_sorted(self, all_hands):
+        assert all_hands.keys() == tuple(sorted(self.expected_keys))
+        assert list(all_hands) == list(all_hands.keys())
+
+    def test_every_key_is_readable(self, all_hands):
+        assert len(dict(all_hands)) == 32
+
+
+class TestLazyParsing:
+    def test_only_header_is_parsed_at_init(self):
+        hand = PokerStarsHand(stars_hands.HAND1)
+        assert hand.header_parsed
+        assert not hand.parsed
+
+    def test_body_is_parsed_on_first_attribute_access(self):
+        hand = PokerStarsHand(stars_hands.HAND1)
+        assert hand.winners == ('W2lkm2n',)
+        assert hand.flop_actions[0] == 'W2lkm2n: bets 80'
+
+    def test_parse_parses_everything(self):
+        hand = PokerStarsHand(stars_hands.HAND1, parse=False)
+        hand.parse()
+        assert hand.header_parsed
+        assert hand.parsed
+        assert hand.hero == 'W2lkm2n'
+
+    def test_parsed_after_every_part_is_parsed_lazily(self, all_hands):
+        dict(all_hands)
+        assert all_hands.parsed
+
+    def test_missing_streets_are_none(self):
+        hand = FullTiltHand(ftp_hands.HAND1)
+        assert hand.turn is None
+        assert hand.river_actions is None
+        assert hand.river_pot is None
+        assert hand.river_num_players is None
+
+    def test_header_is_parsed_on_first_header_attribute_access(self):
+        hand = PokerStarsHand(stars_hands.HAND1, parse=False)
+        assert not hand.header_parsed
+        assert hand.ident == '105024000105'
+        assert hand.header_parsed
+        assert str(hand) == '<PokerStarsHand: STARS hand #105024000105>'
+
+    def test_parsed_after_header_is_parsed_lazily_last(self, all_hands):
+        hand = PokerStarsHand(all_hands.raw, parse=False)
+        hand.winners, hand.river_actions
+        assert not hand.parsed
+        hand.ident
+        assert hand.parsed
+
+    def test_malformed_body_raises_value_error(self):
+        hand = FullTiltHand(ftp_hands.HAND1.replace('Total pot 230', 'Total pot: 230'))
+        with pytest.raises(ValueError):
+            hand.total_pot
+        with pytest.raises(ValueError):
+            hasattr(hand, 'winners')
+
+    @pytest.mark.parametrize('removed_line', ["Table '797469411 15' 9-max Seat #1 is the button\n",
+                                              'Dealt to W2lkm2n [Ac Jh]\n'])
+    def test_stars_body_without_needed_line_raises_value_error(self, removed_line):
+        hand = PokerStarsHand(stars_hands.HAND1.replace(removed_line, ''))
+        with pytest.raises(ValueError):
+            hand.hero
+
+    def test_unknown_attribute_raises_attribute_error(self, all_hands):
+        with pytest.raises(AttributeError):
+            all_hands.not_a_hand_attribute
+
+
+class TestIterHands:
+    history = '\n\n'.join([stars_hands.HAND1, ftp_hands.HAND1, stars_hands.HAND2, pkr_hands.HANDS['holdem_full']])
+
+    def test_finds_every_hand_with_its_room_class(self):
+        hands = list(iter_hands(self.history))
+        assert [type(hand) for hand in hands] == [PokerStarsHand, FullTiltHand, PokerStarsHand, PKRHand]
+
+    def test_hands_are_cut_at_hand_boundaries(self):
+        hands = list(iter_hands(self.history))
+        assert [hand.ident for hand in hands] == ['105024000105', '33286946295', '105034215446', '2433297728']
+        assert hands[0].winners == ('W2lkm2n',)
+        assert hands[2].winners == ('costamar',)
+
+    def test_parse_is_passed_to_hands(self):
+        hand = next(iter_hands(self.history, parse=False))
+        assert not hand.header_parsed
+
+    def test_leading_bom_is_skipped(self):
+        hands = list(iter_hands('\ufeff' + stars_hands.HAND1 + '\n\n' + stars_hands.HAND2))
+        assert [hand.ident for hand in hands] == ['105024000105', '105034215446']
+
+    def test_text_before_the_first_hand_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_hands('garbage\n' + stars_hands.HAND1))
+        with pytest.raises(ValueError):
+            list(iter_hands('garbage\n'))
+
+    def test_empty_history(self):
+        assert list(iter_hands('')) == []
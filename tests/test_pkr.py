@@ -79,3 +79,28 @@ class TestHoldemHand:
                       ])
     def test_body(self, hand, attribute, expected_value):
         assert getattr(hand, attribute) == expected_value
+
+
+class TestFlopOnlyHand:
+    hand_text = HANDS['holdem_flop_only']
+
+    @mark.parametrize('attribute, expected_value', [
+                      ('flop', ('7d', '3c', 'Jd')),
+                      ('flop_pot', D('2.75')),
+                      ('flop_actions', ('barly123 checks',
+                                        'Capricorn bets $1.37',
+                                        'barly123 raises to $4.11',
+                                        'Capricorn calls $4.11')),
+                      ('turn', None),
+                      ('turn_pot', None),
+                      ('turn_actions', None),
+                      ('river', None),
+                      ('river_pot', None),
+                      ('river_actions', None),
+                      ('total_pot', D('10.97')),
+                      ('rake', D('0.54')),
+                      ('winners', ('barly123',)),
+                      ('board', ('7d', '3c', 'Jd'))
+                      ])
+    def test_body(self, hand, attribute, expected_value):
+        assert getattr(hand, attribute) == expected_value